@@ -170,7 +170,10 @@ class CameraVlm:
             max_tokens=config["max_tokens"],
         )
 
-        self._latest_frame: "Image.Image | None" = None
+        # Latest raw frame as (rgba_bytes, width, height). Decoding to PIL is
+        # deferred to the inference loop — at camera fps vs target_fps nearly
+        # every frame is dropped unseen, so converting on receive is wasted work.
+        self._latest_raw: "tuple[bytes, int, int] | None" = None
         self._frame_lock = threading.Lock()
         self._seq = 0
 
@@ -189,13 +192,14 @@ class CameraVlm:
             for env in sub:
                 # CBOR payloads arrive wrapped in a {header, body} Envelope.
                 msg = getattr(env, "body", env)
-                w, h = msg.width, msg.height
-                rgba = np.frombuffer(msg.data, dtype=np.uint8).reshape(h, w, 4)
-                pil_image = Image.fromarray(rgba[:, :, :3], mode="RGB")
-                del rgba, msg, env
+                # Copy out of SHM-backed memory (the view goes stale once the
+                # sample is released) but defer the numpy/PIL conversion to
+                # the inference loop.
+                raw = (bytes(msg.data), msg.width, msg.height)
+                del msg, env
 
                 with self._frame_lock:
-                    self._latest_frame = pil_image
+                    self._latest_raw = raw
 
         def _inference_loop() -> None:
             interval = 1.0 / self._target_fps
@@ -207,15 +211,19 @@ class CameraVlm:
                     continue
 
                 with self._frame_lock:
-                    frame = self._latest_frame
-                    self._latest_frame = None
+                    raw = self._latest_raw
+                    self._latest_raw = None
 
-                if frame is None:
+                if raw is None:
                     time.sleep(0.5)
                     continue
 
                 next_run = time.monotonic() + interval
                 t0 = time.monotonic()
+                data, w, h = raw
+                rgba = np.frombuffer(data, dtype=np.uint8).reshape(h, w, 4)
+                frame = Image.fromarray(rgba[:, :, :3], mode="RGB")
+                del rgba, raw
                 description = self._describer.describe(frame, self._prompt)
                 del frame
                 if torch.cuda.is_available():
@@ -24,6 +24,11 @@ class ParseError:
     message: str
 
 
+# Commands are small control messages; anything bigger is malformed or
+# hostile. Rejecting up front bounds worst-case parse time per query.
+MAX_ENVELOPE_BYTES = 64 * 1024
+
+
 def parse_envelope(raw: bytes) -> tuple[dict | None, ParseError | None]:
     """Decode a query payload into a flat command envelope.
 
@@ -32,6 +37,11 @@ def parse_envelope(raw: bytes) -> tuple[dict | None, ParseError | None]:
     """
     if not raw:
         return None, ParseError("E_EMPTY", "empty command payload")
+    if len(raw) > MAX_ENVELOPE_BYTES:
+        return None, ParseError(
+            "E_TOO_LARGE",
+            f"command payload is {len(raw)} bytes (max {MAX_ENVELOPE_BYTES})",
+        )
     try:
         envelope = json.loads(raw)
     except Exception as exc:
@@ -25,13 +25,13 @@ Wire format is the FLAT envelope established by bubbaloop PR #80; nested
 
 from __future__ import annotations
 
-import json
 import logging
 import os
 import socket
 import threading
 from typing import Optional
 
+import orjson
 import zenoh
 
 from .commands import parse_envelope
@@ -68,6 +68,12 @@ class RecorderNode:
         # shutdown path don't race.
         self._lock = threading.Lock()
         self._active: Optional[RecordingSession] = None
+        # Static dispatch table — built once, not per query.
+        self._handlers = {
+            "start_recording": self._handle_start,
+            "stop_recording": self._handle_stop,
+            "get_status": self._handle_status,
+        }
         log.info(
             "mcap-recorder ready (command-driven), name=%s output_dir=%s",
             self._config.name,
@@ -115,17 +121,12 @@ class RecorderNode:
         assert envelope is not None  # parse_envelope contract: one or the other
 
         cmd = envelope.get("command")
-        handlers = {
-            "start_recording": self._handle_start,
-            "stop_recording": self._handle_stop,
-            "get_status": self._handle_status,
-        }
-        handler = handlers.get(cmd)
+        handler = self._handlers.get(cmd)
         if handler is None:
             self._reply_error(
                 query,
                 "E_UNKNOWN_CMD",
-                f"unknown command {cmd!r}; supported: {sorted(handlers.keys())}",
+                f"unknown command {cmd!r}; supported: {sorted(self._handlers.keys())}",
             )
             return
         try:
@@ -196,15 +197,13 @@ class RecorderNode:
 
     def _reply_ok(self, query: zenoh.Query, body: dict) -> None:
         try:
-            payload = json.dumps(body, default=str).encode()
-            query.reply(query.key_expr, payload)
+            query.reply(query.key_expr, orjson.dumps(body, default=str))
         except Exception as exc:
             log.warning("reply_ok failed: %s", exc)
 
     def _reply_error(self, query: zenoh.Query, code: str, message: str) -> None:
         body = {"status": "error", "code": code, "message": message}
         try:
-            payload = json.dumps(body).encode()
-            query.reply(query.key_expr, payload)
+            query.reply(query.key_expr, orjson.dumps(body))
         except Exception as exc:
             log.warning("reply_error failed: %s", exc)
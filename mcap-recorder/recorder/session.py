@@ -7,7 +7,6 @@ enqueue (cheap, non-blocking), a single writer thread drains and writes.
 
 from __future__ import annotations
 
-import json
 import logging
 import queue
 import threading
@@ -17,6 +16,7 @@ from pathlib import Path
 from typing import Any
 
 import cbor2
+import orjson
 import zenoh
 
 from .mcap_writer import ChunkedMcapWriter, SampleEncoding
@@ -130,8 +130,11 @@ class RecordingSession:
             topic = str(sample.key_expr)
             encoding = SampleEncoding.from_zenoh(str(sample.encoding))
             payload = bytes(sample.payload)
-            ts_ns = self._extract_timestamp(payload, encoding)
-            self._queue.put_nowait((topic, encoding, payload, ts_ns))
+            # Only the cheap wall-clock read happens here; decoding the
+            # payload for an embedded timestamp is deferred to the writer
+            # thread so Zenoh's callback threads never pay for CBOR/JSON
+            # parsing.
+            self._queue.put_nowait((topic, encoding, payload, time.time_ns()))
         except queue.Full:
             self._dropped += 1
             if self._dropped == 1 or self._dropped % 100 == 0:
@@ -139,17 +142,26 @@ class RecordingSession:
         except Exception as exc:
             log.warning("Sample handler error: %s", exc)
 
-    def _extract_timestamp(self, payload: bytes, encoding: SampleEncoding) -> int:
-        """Return ns timestamp for this sample. Wall-clock unless decode is enabled."""
+    def _extract_timestamp(
+        self, payload: bytes, encoding: SampleEncoding, recv_ns: int
+    ) -> int:
+        """Return ns timestamp for this sample.
+
+        `recv_ns` is the wall-clock time captured in the subscriber callback;
+        it's the answer unless decode is enabled and the payload carries a
+        `header.ts_ns`. Runs on the writer thread, never on Zenoh's.
+        """
         if not self._decode_timestamps:
-            return time.time_ns()
+            return recv_ns
         try:
             if encoding.kind == "cbor":
                 obj = cbor2.loads(payload)
             elif encoding.kind == "json":
-                obj = json.loads(payload)
+                # orjson: C-implemented, ~3-10x faster than stdlib json —
+                # this decode runs once per sample when enabled.
+                obj = orjson.loads(payload)
             else:
-                return time.time_ns()
+                return recv_ns
             if isinstance(obj, dict):
                 header = obj.get("header")
                 if isinstance(header, dict):
@@ -158,7 +170,7 @@ class RecordingSession:
                         return ts
         except Exception:
             pass
-        return time.time_ns()
+        return recv_ns
 
     # ------------------------------------------------------------------
     # Writer thread
@@ -181,7 +193,8 @@ class RecordingSession:
             self._write_one(item)
 
     def _write_one(self, item: tuple[str, SampleEncoding, bytes, int]) -> None:
-        topic, encoding, payload, ts_ns = item
+        topic, encoding, payload, recv_ns = item
+        ts_ns = self._extract_timestamp(payload, encoding, recv_ns)
         try:
             with self._writer_lock:
                 self._writer.register_channel(topic, encoding, schema_bytes=None)
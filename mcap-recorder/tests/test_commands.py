@@ -64,3 +64,23 @@ def test_nested_params_loses_top_level_only_to_command():
     assert err is None
     assert env == {"command": "start_recording", "output_dir": "/data"}
     assert "extra_top_level" not in env
+
+
+def test_oversized_payload_returns_E_TOO_LARGE():
+    from recorder.commands import MAX_ENVELOPE_BYTES
+
+    raw = b'{"command": "' + b"x" * MAX_ENVELOPE_BYTES + b'"}'
+    env, err = parse_envelope(raw)
+    assert env is None
+    assert err is not None and err.code == "E_TOO_LARGE"
+
+
+def test_payload_at_limit_is_parsed():
+    from recorder.commands import MAX_ENVELOPE_BYTES
+
+    padding = "x" * (MAX_ENVELOPE_BYTES - 100)
+    raw = json.dumps({"command": "get_status", "pad": padding}).encode()
+    assert len(raw) <= MAX_ENVELOPE_BYTES
+    env, err = parse_envelope(raw)
+    assert err is None
+    assert env["command"] == "get_status"
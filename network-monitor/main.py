@@ -9,6 +9,7 @@ import re
 import socket
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -92,23 +93,29 @@ class NetworkMonitorNode:
         self.sequence = 0
 
         self.pub = ctx.publisher_json(topic)
+        # Checks are independent blocking calls with multi-second timeouts;
+        # run each sweep concurrently so one dead target doesn't hold the
+        # publish loop for timeout × N.
+        self._pool = ThreadPoolExecutor(
+            max_workers=min(8, max(len(self.checks), 1)), thread_name_prefix="check"
+        )
         log.info("Publishing to: %s (%.2f Hz)", ctx.topic(topic), config.get("rate_hz", 0.1))
 
+    _CHECK_FNS = {"http": check_http, "dns": check_dns, "ping": check_ping}
+
     def _run_checks(self) -> list[dict]:
-        results = []
+        futures = []
         for entry in self.checks:
             name = entry.get("name", "")
             kind = entry.get("type", "http").lower()
             target = entry.get("target", "")
-            if kind == "http":
-                results.append(check_http(name, target, self.timeout))
-            elif kind == "dns":
-                results.append(check_dns(name, target, self.timeout))
-            elif kind == "ping":
-                results.append(check_ping(name, target, self.timeout))
-            else:
+            fn = self._CHECK_FNS.get(kind)
+            if fn is None:
                 log.warning("Unknown check type: %s", kind)
-        return results
+                continue
+            futures.append(self._pool.submit(fn, name, target, self.timeout))
+        # Collect in submit order so results stay stable across cycles.
+        return [f.result() for f in futures]
 
     def run(self):
         log.info("Running %d checks every %.0fs", len(self.checks), self.interval)
@@ -8,6 +8,7 @@ Location is auto-discovered from IP or set explicitly in config.
 
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
 import requests
@@ -35,6 +36,11 @@ DAILY_VARS = [
     "sunrise", "sunset",
 ]
 
+# Pre-joined once — the var lists never change at runtime.
+CURRENT_PARAM = ",".join(CURRENT_VARS)
+HOURLY_PARAM = ",".join(HOURLY_VARS)
+DAILY_PARAM = ",".join(DAILY_VARS)
+
 
 # ------------------------------------------------------------------
 # Location resolution
@@ -78,7 +84,7 @@ def resolve_location(config: dict) -> dict:
 def fetch_current(lat: float, lon: float, tz: str) -> dict:
     params = {
         "latitude": lat, "longitude": lon, "timezone": tz,
-        "current": ",".join(CURRENT_VARS),
+        "current": CURRENT_PARAM,
     }
     r = requests.get(BASE_URL, params=params, timeout=10)
     r.raise_for_status()
@@ -96,7 +102,7 @@ def fetch_current(lat: float, lon: float, tz: str) -> dict:
 def fetch_hourly(lat: float, lon: float, tz: str, hours: int) -> dict:
     params = {
         "latitude": lat, "longitude": lon, "timezone": tz,
-        "hourly": ",".join(HOURLY_VARS),
+        "hourly": HOURLY_PARAM,
         "forecast_hours": hours,
         "timeformat": "unixtime",
     }
@@ -104,10 +110,10 @@ def fetch_hourly(lat: float, lon: float, tz: str, hours: int) -> dict:
     r.raise_for_status()
     data = r.json()
     hourly = data["hourly"]
-    entries = [
-        {k: hourly[k][i] for k in hourly}
-        for i in range(len(hourly["time"]))
-    ]
+    # Transpose columns → rows with zip instead of re-walking the dict keys
+    # (and indexing every column list) once per row.
+    keys = list(hourly)
+    entries = [dict(zip(keys, row)) for row in zip(*hourly.values())]
     payload = {
         "latitude": data["latitude"],
         "longitude": data["longitude"],
@@ -121,17 +127,15 @@ def fetch_hourly(lat: float, lon: float, tz: str, hours: int) -> dict:
 def fetch_daily(lat: float, lon: float, tz: str, days: int) -> dict:
     params = {
         "latitude": lat, "longitude": lon, "timezone": tz,
-        "daily": ",".join(DAILY_VARS),
+        "daily": DAILY_PARAM,
         "forecast_days": days,
     }
     r = requests.get(BASE_URL, params=params, timeout=10)
     r.raise_for_status()
     data = r.json()
     daily = data["daily"]
-    entries = [
-        {k: daily[k][i] for k in daily}
-        for i in range(len(daily["time"]))
-    ]
+    keys = list(daily)
+    entries = [dict(zip(keys, row)) for row in zip(*daily.values())]
     payload = {
         "latitude": data["latitude"],
         "longitude": data["longitude"],
@@ -169,6 +173,10 @@ class OpenMeteoNode:
         self.pub_hourly = ctx.publisher_json("weather/hourly")
         self.pub_daily = ctx.publisher_json("weather/daily")
 
+        # The three fetches are independent HTTP calls (10 s timeout each);
+        # overlapping them keeps one slow endpoint from serializing the cycle.
+        self._pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix="fetch")
+
         log.info("Publishing to: %s", ctx.topic("weather/{current,hourly,daily}"))
 
     def run(self):
@@ -181,28 +189,37 @@ class OpenMeteoNode:
         while not self.ctx.is_shutdown():
             now = time.monotonic()
 
-            # Current weather every current_interval
+            # Kick off every fetch that's due, then collect — the calls run
+            # concurrently instead of back-to-back.
+            futures = {"current": self._pool.submit(fetch_current, lat, lon, tz)}
+            if now - last_hourly >= self.hourly_interval:
+                futures["hourly"] = self._pool.submit(
+                    fetch_hourly, lat, lon, tz, self.hourly_hours
+                )
+            if now - last_daily >= self.daily_interval:
+                futures["daily"] = self._pool.submit(
+                    fetch_daily, lat, lon, tz, self.daily_days
+                )
+
             try:
-                data = fetch_current(lat, lon, tz)
+                data = futures["current"].result()
                 self.pub_current.put(data)
                 log.info("current: %.1f°C, wind=%.1f km/h", data["temperature_2m"], data["wind_speed_10m"])
             except Exception as e:
                 log.warning("current fetch failed: %s", e)
 
-            # Hourly forecast
-            if now - last_hourly >= self.hourly_interval:
+            if "hourly" in futures:
                 try:
-                    data = fetch_hourly(lat, lon, tz, self.hourly_hours)
+                    data = futures["hourly"].result()
                     self.pub_hourly.put(data)
                     log.info("hourly: %d entries", len(data["entries"]))
                     last_hourly = now
                 except Exception as e:
                     log.warning("hourly fetch failed: %s", e)
 
-            # Daily forecast
-            if now - last_daily >= self.daily_interval:
+            if "daily" in futures:
                 try:
-                    data = fetch_daily(lat, lon, tz, self.daily_days)
+                    data = futures["daily"].result()
                     self.pub_daily.put(data)
                     log.info("daily: %d entries", len(data["entries"]))
                     last_daily = now